@@ -11,22 +11,40 @@ This server provides tools for:
 Designed to run as a container in Kubernetes, accessed via kagent ToolServer.
 """
 
-import json
+import asyncio
+import bisect
+import copy
+import itertools
+import mmap
 import os
 import logging
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+import aiofiles
+import aiofiles.os
+import httpx
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 import uvicorn
 
 # Configuration from environment
 STATE_PATH = Path(os.getenv("STATE_PATH", "/data/state.json"))
 BACKLOG_PATH = Path(os.getenv("BACKLOG_PATH", "/data/backlog.json"))
 ACCOMPLISHMENTS_PATH = Path(os.getenv("ACCOMPLISHMENTS_PATH", "/data/accomplishments.json"))
+ACCOMPLISHMENTS_LOG = Path(os.getenv("ACCOMPLISHMENTS_LOG", str(ACCOMPLISHMENTS_PATH.with_suffix(".ndjson"))))
 LOG_LEVEL = os.getenv("LOG_LEVEL", "info").upper()
 NOTIFICATION_WEBHOOK = os.getenv("NOTIFICATION_WEBHOOK", "")
+FLUSH_INTERVAL = float(os.getenv("FLUSH_INTERVAL", "0.5"))
+WAKE_PERSIST_INTERVAL = float(os.getenv("WAKE_PERSIST_INTERVAL", "1.0"))
+NOTIFY_QUEUE_SIZE = int(os.getenv("NOTIFY_QUEUE_SIZE", "1024"))
+NOTIFY_WORKERS = int(os.getenv("NOTIFY_WORKERS", "2"))
+RECENT_ACCOMPLISHMENTS = int(os.getenv("RECENT_ACCOMPLISHMENTS", "1000"))
 
 # Setup logging
 logging.basicConfig(
@@ -35,39 +53,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger("wake-tools")
 
-app = FastAPI(
-    title="Wake-Cycle Tools",
-    description="MCP ToolServer for autonomous agent state management",
-    version="1.0.0"
-)
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
 
 # ============================================================================
 # Data Models
 # ============================================================================
 
-class StateUpdate(BaseModel):
-    state: dict = Field(..., description="Complete state object to persist")
-
-class TaskUpdate(BaseModel):
-    task_id: str = Field(..., description="ID of task to update")
-    status: str = Field(..., description="New status: pending, in_progress, completed")
-    notes: Optional[str] = Field(None, description="Optional progress notes")
-
-class NewTask(BaseModel):
-    title: str = Field(..., description="Task title")
-    description: str = Field(..., description="Task description")
-    priority: str = Field(..., description="Priority: low, normal, high, urgent")
+class StateUpdate(msgspec.Struct):
+    state: Annotated[dict, msgspec.Meta(description="Complete state object to persist")]
+
+class TaskUpdate(msgspec.Struct):
+    task_id: Annotated[str, msgspec.Meta(description="ID of task to update")]
+    status: Annotated[str, msgspec.Meta(description="New status: pending, in_progress, completed")]
+    notes: Annotated[Optional[str], msgspec.Meta(description="Optional progress notes")] = None
+
+class NewTask(msgspec.Struct):
+    title: Annotated[str, msgspec.Meta(description="Task title")]
+    description: Annotated[str, msgspec.Meta(description="Task description")]
+    priority: Annotated[str, msgspec.Meta(description="Priority: low, normal, high, urgent")]
+
+class Accomplishment(msgspec.Struct):
+    category: Annotated[str, msgspec.Meta(description="Category of work")]
+    description: Annotated[str, msgspec.Meta(description="What was accomplished")]
+    impact: Annotated[str, msgspec.Meta(description="Impact level: low, medium, high")]
+    artifacts: Annotated[list[str], msgspec.Meta(description="Created artifacts")] = []
+
+class Notification(msgspec.Struct):
+    message: Annotated[str, msgspec.Meta(description="Notification message")]
+    priority: Annotated[str, msgspec.Meta(description="Priority: low, normal, high, urgent")]
+    channel: Annotated[str, msgspec.Meta(description="Notification channel")] = "webhook"
+
+def body_error(message: str) -> HTTPException:
+    """Build a 422 error with the same detail shape as FastAPI validation errors."""
+    return HTTPException(
+        status_code=422,
+        detail=[{"loc": ["body"], "msg": message, "type": "value_error"}]
+    )
+
+def json_body(model: type):
+    """Build a dependency that decodes and validates the request body with msgspec."""
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise body_error(str(e))
 
-class Accomplishment(BaseModel):
-    category: str = Field(..., description="Category of work")
-    description: str = Field(..., description="What was accomplished")
-    impact: str = Field(..., description="Impact level: low, medium, high")
-    artifacts: list[str] = Field(default=[], description="Created artifacts")
+    return decode
 
-class Notification(BaseModel):
-    message: str = Field(..., description="Notification message")
-    priority: str = Field(..., description="Priority: low, normal, high, urgent")
-    channel: str = Field(default="webhook", description="Notification channel")
+def request_body(model: type) -> dict:
+    """OpenAPI requestBody for a route whose body is decoded by json_body()."""
+    _, components = msgspec.json.schema_components([model])
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}}
+        }
+    }
 
 # ============================================================================
 # Helper Functions
@@ -77,23 +124,59 @@ def ensure_data_dir():
     """Ensure data directory exists."""
     STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-def load_json(path: Path, default: dict) -> dict:
-    """Load JSON file, returning default if not found."""
+def read_json_mapped(path: Path):
+    """Parse a JSON file straight from a read-only memory map."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+async def load_json(path: Path, default: dict) -> dict:
+    """Load JSON file, returning default if not found.
+
+    Only used at startup and during compaction, so the file is parsed from a
+    memory map in a worker thread instead of being read into a bytes copy.
+    """
     try:
-        if path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
+        if await aiofiles.os.path.exists(path):
+            return await asyncio.to_thread(read_json_mapped, path)
     except Exception as e:
         logger.warning(f"Error loading {path}: {e}")
-    return default
+    return copy.deepcopy(default)
 
-def save_json(path: Path, data: dict):
-    """Save data to JSON file atomically."""
-    ensure_data_dir()
+async def save_json(path: Path, data: dict):
+    """Save data to JSON file atomically and durably.
+
+    The data directory is created once at startup, not on every save.
+    """
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
     temp_path = path.with_suffix(".tmp")
-    with open(temp_path, "w") as f:
-        json.dump(data, f, indent=2)
-    temp_path.rename(path)
+    async with aiofiles.open(temp_path, "wb") as f:
+        await f.write(content)
+        await f.flush()
+        await asyncio.to_thread(os.fsync, f.fileno())
+    await aiofiles.os.replace(temp_path, path)
+
+async def append_ndjson(path: Path, entry: dict):
+    """Append a single record to a JSON-Lines log."""
+    async with aiofiles.open(path, "ab") as f:
+        await f.write(orjson.dumps(entry) + b"\n")
+
+async def iter_ndjson(path: Path):
+    """Stream records from a JSON-Lines log, skipping malformed lines."""
+    if not await aiofiles.os.path.exists(path):
+        return
+    async with aiofiles.open(path, "rb") as f:
+        async for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"Skipping malformed line in {path}: {e}")
 
 def now_iso() -> str:
     """Get current UTC time in ISO format."""
@@ -116,6 +199,7 @@ DEFAULT_STATE = {
         "read_backlog": True,
         "update_task": True,
         "log_accomplishment": True,
+        "read_accomplishments": True,
         "send_notification": True
     },
     "metrics": {
@@ -126,13 +210,307 @@ DEFAULT_STATE = {
 }
 
 DEFAULT_BACKLOG = {
-    "tasks": []
+    "tasks": [],
+    "_next_id": 1
 }
 
+# Tasks carry their priority rank in "_prio" and the backlog is kept sorted
+# by it, so reads never have to sort.
+PRIORITY_ORDER = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+
+# Task lookup by ID, kept alongside the cached backlog rather than inside it
+# so it is never written to disk.
+TASK_INDEX: dict[str, dict] = {}
+
+def priority_rank(priority: str) -> int:
+    """Get the sort rank for a priority, treating unknown values as normal."""
+    return PRIORITY_ORDER.get(priority, 2)
+
+def prepare_backlog(backlog: dict):
+    """Ensure every task has a priority rank and the backlog is sorted by it.
+
+    Also rebuilds TASK_INDEX. Backlogs written before the task ID counter
+    existed get "_next_id" seeded past the highest generated task ID.
+    """
+    tasks = backlog.setdefault("tasks", [])
+    TASK_INDEX.clear()
+    last_id = 0
+    for task in tasks:
+        task["_prio"] = priority_rank(task.get("priority", "normal"))
+        if "id" in task:
+            TASK_INDEX.setdefault(task["id"], task)
+        prefix, _, num = task.get("id", "").partition("-")
+        if prefix == "task" and num.isdigit():
+            last_id = max(last_id, int(num))
+    tasks.sort(key=lambda t: t["_prio"])
+    backlog.setdefault("_next_id", last_id + 1)
+
 DEFAULT_ACCOMPLISHMENTS = {
-    "accomplishments": []
+    "accomplishments": [],
+    "folded_through": 0
 }
 
+# ============================================================================
+# Document Cache
+# ============================================================================
+
+# Documents are loaded once at startup and served from memory. Handlers
+# mutate the cached dicts and mark them dirty; a background flusher writes
+# dirty documents back to disk every FLUSH_INTERVAL seconds.
+#
+# Handlers never await between reading and mutating a cached document, so
+# each read-modify-write (such as the wake_count increment in read_state) is
+# atomic on the event loop. LOCKS serializes the awaited file writes for each
+# path so overlapping flushes, appends and compactions cannot interleave.
+STATE_CACHE: dict[Path, dict] = {}
+DIRTY: set[Path] = set()
+DEFERRED: dict[Path, float] = {}
+LOCKS: defaultdict[Path, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+def get_doc(path: Path) -> dict:
+    """Get the cached document for a path."""
+    return STATE_CACHE[path]
+
+def put_doc(path: Path, data: dict):
+    """Replace the cached document for a path and mark it dirty.
+
+    Raises orjson.JSONEncodeError, leaving the cache untouched, if the
+    document could never be written to disk.
+    """
+    orjson.dumps(data)
+    STATE_CACHE[path] = data
+    DIRTY.add(path)
+
+def mark_dirty(*paths: Path):
+    """Schedule cached documents to be written on the next flush."""
+    DIRTY.update(paths)
+
+def mark_dirty_later(path: Path, delay: float):
+    """Schedule a cached document to be written once delay seconds have passed.
+
+    Repeated calls before the write do not push the deadline back, so a
+    burst of changes costs a single write.
+    """
+    DEFERRED.setdefault(path, time.monotonic() + delay)
+
+async def save_doc(path: Path):
+    """Write a cached document to disk while holding its lock."""
+    async with LOCKS[path]:
+        await save_json(path, STATE_CACHE[path])
+
+async def flush_dirty(include_deferred: bool = False):
+    """Write all dirty documents to disk in a single pass.
+
+    Deferred documents are written once due, or unconditionally when
+    include_deferred is set.
+    """
+    now = time.monotonic()
+    for path, due in list(DEFERRED.items()):
+        if include_deferred or due <= now:
+            DIRTY.add(path)
+    if not DIRTY:
+        return
+    paths = list(DIRTY)
+    DIRTY.clear()
+    for path in paths:
+        DEFERRED.pop(path, None)
+    try:
+        results = await asyncio.gather(
+            *(save_doc(path) for path in paths),
+            return_exceptions=True
+        )
+    except asyncio.CancelledError:
+        # Keep the documents dirty so the shutdown flush still writes them
+        DIRTY.update(paths)
+        raise
+    for path, result in zip(paths, results):
+        if isinstance(result, orjson.JSONEncodeError):
+            # Retrying cannot help; keep the last good copy on disk
+            logger.error(f"Cannot encode {path}, not retrying: {result}")
+        elif isinstance(result, Exception):
+            DIRTY.add(path)
+            logger.error(f"Error saving {path}: {result}")
+
+async def flusher():
+    """Periodically flush dirty documents."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL)
+        await flush_dirty()
+
+async def load_documents():
+    """Load all documents into the cache, initializing missing files."""
+    # Locks bind to the running loop on first use; start fresh on each startup
+    LOCKS.clear()
+    ensure_data_dir()
+    for path, default, name in (
+        (STATE_PATH, DEFAULT_STATE, "state"),
+        (BACKLOG_PATH, DEFAULT_BACKLOG, "backlog"),
+    ):
+        exists = path.exists()
+        STATE_CACHE[path] = await load_json(path, default)
+        if not exists:
+            mark_dirty(path)
+            logger.info(f"Initialized {name} file")
+    prepare_backlog(STATE_CACHE[BACKLOG_PATH])
+    await flush_dirty()
+
+# ============================================================================
+# Accomplishment Log
+# ============================================================================
+
+# Accomplishments are appended to ACCOMPLISHMENTS_LOG (JSON Lines) so each
+# write costs O(1) bytes. ACCOMPLISHMENTS_PATH is kept as a snapshot that the
+# log is folded into on shutdown. The most recent entries are also kept in a
+# bounded in-memory buffer so reads never touch disk.
+#
+# Folding into the snapshot has to parse and rewrite the full history, so its
+# peak memory grows with the history. To keep startup bounded, compaction also
+# writes the last RECENT_ACCOMPLISHMENTS entries to ACCOMPLISHMENTS_TAIL, and
+# startup seeds the buffer from that file plus a streamed pass over the log
+# without reading the snapshot.
+#
+# Every log entry carries a sequence number and the snapshot and tail record
+# the last one folded into them, so if a compaction is interrupted before the
+# log is truncated, the leftover lines are skipped.
+ACCOMPLISHMENTS_TAIL = ACCOMPLISHMENTS_PATH.with_suffix(".recent.json")
+ACCOMPLISHMENT_RECENT: deque = deque(maxlen=RECENT_ACCOMPLISHMENTS)
+ACCOMPLISHMENT_SEQ = itertools.count(1)
+
+async def compact_accomplishments():
+    """Fold the accomplishments log into the snapshot and truncate the log.
+
+    Loads the full history, so this only runs on shutdown, or on startup when
+    there is no tail file yet.
+    """
+    async with LOCKS[ACCOMPLISHMENTS_LOG]:
+        exists = ACCOMPLISHMENTS_PATH.exists()
+        snapshot = await load_json(ACCOMPLISHMENTS_PATH, DEFAULT_ACCOMPLISHMENTS)
+        records = snapshot.setdefault("accomplishments", [])
+        folded_through = snapshot.get("folded_through", 0)
+        last_seq = folded_through
+        count = 0
+        lines = 0
+        async for entry in iter_ndjson(ACCOMPLISHMENTS_LOG):
+            lines += 1
+            seq = entry.get("seq")
+            if isinstance(seq, int):
+                if seq <= folded_through:
+                    continue
+                last_seq = max(last_seq, seq)
+            records.append(entry)
+            count += 1
+        snapshot["folded_through"] = last_seq
+        if count or not exists:
+            await save_json(ACCOMPLISHMENTS_PATH, snapshot)
+        if count or not ACCOMPLISHMENTS_TAIL.exists():
+            await save_json(ACCOMPLISHMENTS_TAIL, {
+                "accomplishments": records[-RECENT_ACCOMPLISHMENTS:],
+                "folded_through": last_seq
+            })
+        if lines:
+            async with aiofiles.open(ACCOMPLISHMENTS_LOG, "wb"):
+                pass
+    if count:
+        logger.info(f"Compacted {count} accomplishments into snapshot")
+    elif not exists:
+        logger.info("Initialized accomplishments file")
+
+async def load_recent_accomplishments():
+    """Seed the recent buffer and sequence counter from the tail file and log."""
+    global ACCOMPLISHMENT_SEQ
+    if not ACCOMPLISHMENTS_TAIL.exists():
+        await compact_accomplishments()
+    tail = await load_json(ACCOMPLISHMENTS_TAIL, DEFAULT_ACCOMPLISHMENTS)
+    folded_through = tail.get("folded_through", 0)
+    last_seq = folded_through
+    ACCOMPLISHMENT_RECENT.clear()
+    ACCOMPLISHMENT_RECENT.extend(tail.get("accomplishments", []))
+    async with LOCKS[ACCOMPLISHMENTS_LOG]:
+        async for entry in iter_ndjson(ACCOMPLISHMENTS_LOG):
+            seq = entry.get("seq")
+            if isinstance(seq, int):
+                if seq <= folded_through:
+                    continue
+                last_seq = max(last_seq, seq)
+            ACCOMPLISHMENT_RECENT.append(entry)
+    ACCOMPLISHMENT_SEQ = itertools.count(last_seq + 1)
+
+# ============================================================================
+# Notification Delivery
+# ============================================================================
+
+# Webhook notifications are queued and delivered by background workers so
+# handlers never wait on the webhook. When the queue is full the oldest
+# pending notification is dropped.
+
+def enqueue_notification(queue: asyncio.Queue, payload: dict):
+    """Queue a webhook payload, dropping the oldest one if the queue is full."""
+    if queue.full():
+        dropped = queue.get_nowait()
+        queue.task_done()
+        logger.warning(f"Notification queue full, dropped: {dropped['message'][:50]}...")
+    queue.put_nowait(payload)
+
+async def notification_worker(queue: asyncio.Queue, client: httpx.AsyncClient):
+    """Deliver queued webhook notifications."""
+    while True:
+        payload = await queue.get()
+        try:
+            await client.post(NOTIFICATION_WEBHOOK, json=payload)
+        except Exception as e:
+            logger.error(f"Failed to send webhook: {e}")
+        finally:
+            queue.task_done()
+
+async def cancel_tasks(*tasks: asyncio.Task):
+    """Cancel background tasks and wait for them to finish."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Preload documents and start background workers; drain and flush on shutdown."""
+    await load_documents()
+    await load_recent_accomplishments()
+
+    # The HTTP client and delivery workers only exist if a webhook is configured
+    app.state.webhook_enabled = bool(NOTIFICATION_WEBHOOK)
+    workers = []
+    if app.state.webhook_enabled:
+        app.state.http = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+        app.state.notify_q = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+        workers = [
+            asyncio.create_task(notification_worker(app.state.notify_q, app.state.http))
+            for _ in range(NOTIFY_WORKERS)
+        ]
+    flusher_task = asyncio.create_task(flusher())
+    try:
+        yield
+    finally:
+        if app.state.webhook_enabled:
+            try:
+                await asyncio.wait_for(app.state.notify_q.join(), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {app.state.notify_q.qsize()} undelivered notifications")
+            await cancel_tasks(*workers)
+            await app.state.http.aclose()
+        await cancel_tasks(flusher_task)
+        await flush_dirty(include_deferred=True)
+        await compact_accomplishments()
+        logger.info("Flushed documents on shutdown")
+
+app = FastAPI(
+    title="Wake-Cycle Tools",
+    description="MCP ToolServer for autonomous agent state management",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+
 # ============================================================================
 # Tool Endpoints
 # ============================================================================
@@ -140,7 +518,7 @@ DEFAULT_ACCOMPLISHMENTS = {
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": now_iso()}
+    return ORJSONResponse({"status": "healthy", "timestamp": now_iso()})
 
 @app.post("/tools/read_state")
 async def read_state():
@@ -148,29 +526,30 @@ async def read_state():
     Read the agent's current state from persistent storage.
     """
     logger.info("Reading state")
-    state = load_json(STATE_PATH, DEFAULT_STATE)
+    state = get_doc(STATE_PATH)
+    ts = now_iso()
 
     # Update wake metadata
     state["wake_count"] = state.get("wake_count", 0) + 1
-    state["last_wake"] = now_iso()
+    state["last_wake"] = ts
     if not state.get("created_at"):
-        state["created_at"] = now_iso()
+        state["created_at"] = ts
 
-    # Persist the updated wake count
-    save_json(STATE_PATH, state)
+    # Persist the updated wake count, at most once per WAKE_PERSIST_INTERVAL
+    mark_dirty_later(STATE_PATH, WAKE_PERSIST_INTERVAL)
 
     logger.info(f"State loaded: wake #{state['wake_count']}, focus: {state.get('current_focus')}")
     return {"success": True, "state": state}
 
-@app.post("/tools/write_state")
-async def write_state(update: StateUpdate):
+@app.post("/tools/write_state", openapi_extra=request_body(StateUpdate))
+async def write_state(update: StateUpdate = Depends(json_body(StateUpdate))):
     """
     Update the agent's state in persistent storage.
     """
     logger.info("Writing state")
 
     # Load existing state to preserve metadata
-    existing = load_json(STATE_PATH, DEFAULT_STATE)
+    existing = get_doc(STATE_PATH)
 
     # Merge new state with existing
     new_state = update.state
@@ -179,7 +558,10 @@ async def write_state(update: StateUpdate):
     new_state["created_at"] = existing.get("created_at")
     new_state["last_wake"] = existing.get("last_wake")
 
-    save_json(STATE_PATH, new_state)
+    try:
+        put_doc(STATE_PATH, new_state)
+    except orjson.JSONEncodeError as e:
+        raise body_error(f"State cannot be stored as JSON: {e}")
 
     logger.info(f"State updated: focus: {new_state.get('current_focus')}")
     return {"success": True, "message": "State updated"}
@@ -190,65 +572,57 @@ async def read_backlog(status_filter: str = "all"):
     Read the agent's task backlog.
     """
     logger.info(f"Reading backlog (filter: {status_filter})")
-    backlog = load_json(BACKLOG_PATH, DEFAULT_BACKLOG)
+    backlog = get_doc(BACKLOG_PATH)
 
     tasks = backlog.get("tasks", [])
 
+    # Tasks are already sorted by priority
     if status_filter != "all":
         tasks = [t for t in tasks if t.get("status") == status_filter]
 
-    # Sort by priority
-    priority_order = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
-    tasks.sort(key=lambda t: priority_order.get(t.get("priority", "normal"), 2))
-
     logger.info(f"Found {len(tasks)} tasks")
     return {"success": True, "tasks": tasks, "total": len(tasks)}
 
-@app.post("/tools/update_task")
-async def update_task(update: TaskUpdate):
+@app.post("/tools/update_task", openapi_extra=request_body(TaskUpdate))
+async def update_task(update: TaskUpdate = Depends(json_body(TaskUpdate))):
     """
     Update a task's status in the backlog.
     """
     logger.info(f"Updating task {update.task_id} to {update.status}")
-    backlog = load_json(BACKLOG_PATH, DEFAULT_BACKLOG)
-
-    task_found = False
-    for task in backlog.get("tasks", []):
-        if task.get("id") == update.task_id:
-            task["status"] = update.status
-            task["updated_at"] = now_iso()
-            if update.notes:
-                task["notes"] = update.notes
-            if update.status == "completed":
-                task["completed_at"] = now_iso()
-            task_found = True
-            break
-
-    if not task_found:
+    ts = now_iso()
+
+    task = TASK_INDEX.get(update.task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail=f"Task {update.task_id} not found")
 
-    save_json(BACKLOG_PATH, backlog)
+    task["status"] = update.status
+    task["updated_at"] = ts
+    if update.notes:
+        task["notes"] = update.notes
+    if update.status == "completed":
+        task["completed_at"] = ts
+    mark_dirty(BACKLOG_PATH)
 
-    # Update state metrics if completed
+    # Update state metrics if completed; both documents go out in one flush
     if update.status == "completed":
-        state = load_json(STATE_PATH, DEFAULT_STATE)
-        state["metrics"]["tasks_completed"] = state["metrics"].get("tasks_completed", 0) + 1
-        save_json(STATE_PATH, state)
+        metrics = get_doc(STATE_PATH).setdefault("metrics", {})
+        metrics["tasks_completed"] = metrics.get("tasks_completed", 0) + 1
+        mark_dirty(STATE_PATH)
 
     logger.info(f"Task {update.task_id} updated to {update.status}")
     return {"success": True, "message": f"Task {update.task_id} updated to {update.status}"}
 
-@app.post("/tools/add_task")
-async def add_task(task: NewTask):
+@app.post("/tools/add_task", openapi_extra=request_body(NewTask))
+async def add_task(task: NewTask = Depends(json_body(NewTask))):
     """
     Add a new task to the backlog.
     """
     logger.info(f"Adding task: {task.title}")
-    backlog = load_json(BACKLOG_PATH, DEFAULT_BACKLOG)
+    backlog = get_doc(BACKLOG_PATH)
 
     # Generate task ID
-    existing_ids = [t.get("id", "") for t in backlog.get("tasks", [])]
-    task_num = len(existing_ids) + 1
+    task_num = backlog["_next_id"]
+    backlog["_next_id"] = task_num + 1
     task_id = f"task-{task_num:03d}"
 
     new_task = {
@@ -257,27 +631,29 @@ async def add_task(task: NewTask):
         "description": task.description,
         "priority": task.priority,
         "status": "pending",
-        "created_at": now_iso()
+        "created_at": now_iso(),
+        "_prio": priority_rank(task.priority)
     }
 
     if "tasks" not in backlog:
         backlog["tasks"] = []
-    backlog["tasks"].append(new_task)
+    bisect.insort(backlog["tasks"], new_task, key=lambda t: t["_prio"])
+    TASK_INDEX[task_id] = new_task
 
-    save_json(BACKLOG_PATH, backlog)
+    mark_dirty(BACKLOG_PATH)
 
     logger.info(f"Task {task_id} added")
     return {"success": True, "task_id": task_id, "message": f"Task added: {task.title}"}
 
-@app.post("/tools/log_accomplishment")
-async def log_accomplishment(accomplishment: Accomplishment):
+@app.post("/tools/log_accomplishment", openapi_extra=request_body(Accomplishment))
+async def log_accomplishment(accomplishment: Accomplishment = Depends(json_body(Accomplishment))):
     """
     Log a completed piece of work.
     """
     logger.info(f"Logging accomplishment: {accomplishment.description[:50]}...")
-    accomplishments = load_json(ACCOMPLISHMENTS_PATH, DEFAULT_ACCOMPLISHMENTS)
 
     entry = {
+        "seq": next(ACCOMPLISHMENT_SEQ),
         "timestamp": now_iso(),
         "category": accomplishment.category,
         "description": accomplishment.description,
@@ -285,31 +661,43 @@ async def log_accomplishment(accomplishment: Accomplishment):
         "artifacts": accomplishment.artifacts
     }
 
-    if "accomplishments" not in accomplishments:
-        accomplishments["accomplishments"] = []
-    accomplishments["accomplishments"].append(entry)
-
-    save_json(ACCOMPLISHMENTS_PATH, accomplishments)
+    async with LOCKS[ACCOMPLISHMENTS_LOG]:
+        await append_ndjson(ACCOMPLISHMENTS_LOG, entry)
+    ACCOMPLISHMENT_RECENT.append(entry)
 
     # Update state metrics
-    state = load_json(STATE_PATH, DEFAULT_STATE)
-    state["metrics"]["total_accomplishments"] = state["metrics"].get("total_accomplishments", 0) + 1
-    save_json(STATE_PATH, state)
+    metrics = get_doc(STATE_PATH).setdefault("metrics", {})
+    metrics["total_accomplishments"] = metrics.get("total_accomplishments", 0) + 1
+    mark_dirty(STATE_PATH)
 
     logger.info(f"Accomplishment logged ({accomplishment.impact} impact)")
     return {"success": True, "message": "Accomplishment logged"}
 
-@app.post("/tools/send_notification")
-async def send_notification(notification: Notification):
+@app.post("/tools/read_accomplishments")
+async def read_accomplishments():
+    """
+    Read the most recently logged accomplishments.
+    """
+    logger.info("Reading recent accomplishments")
+    accomplishments = list(ACCOMPLISHMENT_RECENT)
+
+    logger.info(f"Found {len(accomplishments)} accomplishments")
+    return {"success": True, "accomplishments": accomplishments, "total": len(accomplishments)}
+
+@app.post("/tools/send_notification", openapi_extra=request_body(Notification))
+async def send_notification(
+    response: Response,
+    notification: Notification = Depends(json_body(Notification))
+):
     """
     Send a notification to the principal.
     """
     logger.info(f"Sending notification ({notification.priority}): {notification.message[:50]}...")
 
     # Update metrics
-    state = load_json(STATE_PATH, DEFAULT_STATE)
+    state = get_doc(STATE_PATH)
     state["metrics"]["notifications_sent"] = state["metrics"].get("notifications_sent", 0) + 1
-    save_json(STATE_PATH, state)
+    mark_dirty(STATE_PATH)
 
     # For demo purposes, just log. In production, send via webhook/email/etc.
     if notification.priority in ["high", "urgent"]:
@@ -317,22 +705,15 @@ async def send_notification(notification: Notification):
     else:
         logger.info(f"NOTIFICATION [{notification.priority}]: {notification.message}")
 
-    # If webhook configured, send it
-    if NOTIFICATION_WEBHOOK and notification.priority in ["high", "urgent"]:
-        import httpx
-        try:
-            async with httpx.AsyncClient() as client:
-                await client.post(
-                    NOTIFICATION_WEBHOOK,
-                    json={
-                        "message": notification.message,
-                        "priority": notification.priority,
-                        "timestamp": now_iso()
-                    },
-                    timeout=10.0
-                )
-        except Exception as e:
-            logger.error(f"Failed to send webhook: {e}")
+    # If webhook configured, queue it for delivery
+    if app.state.webhook_enabled and notification.priority in ["high", "urgent"]:
+        enqueue_notification(app.state.notify_q, {
+            "message": notification.message,
+            "priority": notification.priority,
+            "timestamp": now_iso()
+        })
+        response.status_code = 202
+        return {"success": True, "message": "Notification queued"}
 
     return {"success": True, "message": "Notification sent"}
 
@@ -340,66 +721,77 @@ async def send_notification(notification: Notification):
 # MCP Server Info
 # ============================================================================
 
+# Static responses are encoded once at import time
+_ROOT_BODY = orjson.dumps({
+    "name": "wake-cycle-tools",
+    "version": "1.0.0",
+    "description": "MCP ToolServer for autonomous agent state management",
+    "tools": [
+        "read_state",
+        "write_state",
+        "read_backlog",
+        "update_task",
+        "add_task",
+        "log_accomplishment",
+        "read_accomplishments",
+        "send_notification"
+    ]
+})
+
 @app.get("/")
 async def root():
     """MCP server info."""
-    return {
-        "name": "wake-cycle-tools",
-        "version": "1.0.0",
-        "description": "MCP ToolServer for autonomous agent state management",
-        "tools": [
-            "read_state",
-            "write_state",
-            "read_backlog",
-            "update_task",
-            "add_task",
-            "log_accomplishment",
-            "send_notification"
-        ]
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+_TOOLS_BODY = orjson.dumps({
+    "tools": [
+        {
+            "name": "read_state",
+            "description": "Read agent state from persistent storage",
+            "inputSchema": {"type": "object", "properties": {}}
+        },
+        {
+            "name": "write_state",
+            "description": "Update agent state",
+            "inputSchema": {"type": "object", "properties": {"state": {"type": "object"}}, "required": ["state"]}
+        },
+        {
+            "name": "read_backlog",
+            "description": "Read task backlog",
+            "inputSchema": {"type": "object", "properties": {"status_filter": {"type": "string"}}}
+        },
+        {
+            "name": "update_task",
+            "description": "Update task status",
+            "inputSchema": {"type": "object", "properties": {"task_id": {"type": "string"}, "status": {"type": "string"}}, "required": ["task_id", "status"]}
+        },
+        {
+            "name": "add_task",
+            "description": "Add new task to backlog",
+            "inputSchema": {"type": "object", "properties": {"title": {"type": "string"}, "description": {"type": "string"}, "priority": {"type": "string"}}, "required": ["title", "description", "priority"]}
+        },
+        {
+            "name": "log_accomplishment",
+            "description": "Log completed work",
+            "inputSchema": {"type": "object", "properties": {"category": {"type": "string"}, "description": {"type": "string"}, "impact": {"type": "string"}}, "required": ["category", "description", "impact"]}
+        },
+        {
+            "name": "read_accomplishments",
+            "description": "Read recently logged accomplishments",
+            "inputSchema": {"type": "object", "properties": {}}
+        },
+        {
+            "name": "send_notification",
+            "description": "Send notification to principal",
+            "inputSchema": {"type": "object", "properties": {"message": {"type": "string"}, "priority": {"type": "string"}}, "required": ["message", "priority"]}
+        }
+    ]
+})
 
 @app.get("/mcp/tools")
 async def list_tools():
     """List available tools in MCP format."""
-    return {
-        "tools": [
-            {
-                "name": "read_state",
-                "description": "Read agent state from persistent storage",
-                "inputSchema": {"type": "object", "properties": {}}
-            },
-            {
-                "name": "write_state",
-                "description": "Update agent state",
-                "inputSchema": {"type": "object", "properties": {"state": {"type": "object"}}, "required": ["state"]}
-            },
-            {
-                "name": "read_backlog",
-                "description": "Read task backlog",
-                "inputSchema": {"type": "object", "properties": {"status_filter": {"type": "string"}}}
-            },
-            {
-                "name": "update_task",
-                "description": "Update task status",
-                "inputSchema": {"type": "object", "properties": {"task_id": {"type": "string"}, "status": {"type": "string"}}, "required": ["task_id", "status"]}
-            },
-            {
-                "name": "add_task",
-                "description": "Add new task to backlog",
-                "inputSchema": {"type": "object", "properties": {"title": {"type": "string"}, "description": {"type": "string"}, "priority": {"type": "string"}}, "required": ["title", "description", "priority"]}
-            },
-            {
-                "name": "log_accomplishment",
-                "description": "Log completed work",
-                "inputSchema": {"type": "object", "properties": {"category": {"type": "string"}, "description": {"type": "string"}, "impact": {"type": "string"}}, "required": ["category", "description", "impact"]}
-            },
-            {
-                "name": "send_notification",
-                "description": "Send notification to principal",
-                "inputSchema": {"type": "object", "properties": {"message": {"type": "string"}, "priority": {"type": "string"}}, "required": ["message", "priority"]}
-            }
-        ]
-    }
+    return Response(content=_TOOLS_BODY, media_type="application/json")
 
 # ============================================================================
 # Main
@@ -411,16 +803,6 @@ if __name__ == "__main__":
     logger.info(f"State path: {STATE_PATH}")
     logger.info(f"Backlog path: {BACKLOG_PATH}")
 
-    # Initialize data files if they don't exist
-    ensure_data_dir()
-    if not STATE_PATH.exists():
-        save_json(STATE_PATH, DEFAULT_STATE)
-        logger.info("Initialized state file")
-    if not BACKLOG_PATH.exists():
-        save_json(BACKLOG_PATH, DEFAULT_BACKLOG)
-        logger.info("Initialized backlog file")
-    if not ACCOMPLISHMENTS_PATH.exists():
-        save_json(ACCOMPLISHMENTS_PATH, DEFAULT_ACCOMPLISHMENTS)
-        logger.info("Initialized accomplishments file")
-
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Documents are cached in process memory, so the server must run as a
+    # single worker; uvloop and httptools speed up that one event loop.
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop", http="httptools")